@@ -33,6 +33,7 @@ from enum import Enum
 from decimal import Decimal
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import lambda_stmt, select
 
 logger = logging.getLogger("flask.app")
 
@@ -169,6 +170,23 @@ class Product(db.Model):
         app.app_context().push()
         db.create_all()  # make our sqlalchemy tables
 
+    @classmethod
+    def _find_where(cls, criteria) -> list:
+        """Returns all Products that match a lambda criteria
+
+        The statement is built with lambda_stmt() so its compiled SQL is
+        cached and reused on every call, only the parameters change
+
+        :param criteria: a lambda that adds a where clause to a select
+        :type criteria: function
+
+        :return: a collection of matching Products
+        :rtype: list
+
+        """
+        stmt = lambda_stmt(lambda: select(cls)) + criteria
+        return db.session.scalars(stmt).all()
+
     @classmethod
     def all(cls) -> list:
         """Returns all of the Products in the database"""
@@ -201,7 +219,7 @@ class Product(db.Model):
 
         """
         logger.info("Processing name query for %s ...", name)
-        return cls.query.filter(cls.name == name)
+        return cls._find_where(lambda s: s.where(cls.name == name))
 
     @classmethod
     def find_by_price(cls, price: Decimal) -> list:
@@ -218,7 +236,7 @@ class Product(db.Model):
         price_value = price
         if isinstance(price, str):
             price_value = Decimal(price.strip(' "'))
-        return cls.query.filter(cls.price == price_value)
+        return cls._find_where(lambda s: s.where(cls.price == price_value))
 
     @classmethod
     def find_by_availability(cls, available: bool = True) -> list:
@@ -232,7 +250,7 @@ class Product(db.Model):
 
         """
         logger.info("Processing available query for %s ...", available)
-        return cls.query.filter(cls.available == available)
+        return cls._find_where(lambda s: s.where(cls.available == available))
 
     @classmethod
     def find_by_category(cls, category: Category = Category.UNKNOWN) -> list:
@@ -246,4 +264,4 @@ class Product(db.Model):
 
         """
         logger.info("Processing category query for %s ...", category.name)
-        return cls.query.filter(cls.category == category)
+        return cls._find_where(lambda s: s.where(cls.category == category))
@@ -29,6 +29,8 @@ import logging
 from decimal import Decimal
 from unittest import TestCase
 from urllib.parse import quote_plus
+import pytest
+from sqlalchemy import delete
 from service import app
 from service.common import status
 from service.models import db, init_db, Product
@@ -48,7 +50,9 @@ BASE_URL = "/products"
 ######################################################################
 #  T E S T   C A S E S
 ######################################################################
+# The routes share the DATABASE_URI database so they cannot run in parallel
 # pylint: disable=too-many-public-methods
+@pytest.mark.serial
 class TestProductRoutes(TestCase):
     """Product Service tests"""
 
@@ -70,7 +74,10 @@ class TestProductRoutes(TestCase):
     def setUp(self):
         """Runs before each test"""
         self.client = app.test_client()
-        db.session.query(Product).delete()  # clean up the last tests
+        # clean up the last tests, the session is empty so skip synchronizing it
+        db.session.execute(
+            delete(Product).execution_options(synchronize_session=False)
+        )
         db.session.commit()
 
     def tearDown(self):